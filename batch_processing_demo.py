@@ -11,10 +11,14 @@ Based on the solution described in GitHub issue #1434:
 https://github.com/huggingface/lerobot/issues/1434#issuecomment-3046764836
 """
 
+import contextlib
 import logging
+import shutil
 import time
 from pathlib import Path
 
+import numpy as np
+
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.datasets.video_utils import VideoEncodingManager
 
@@ -22,13 +26,17 @@ from lerobot.datasets.video_utils import VideoEncodingManager
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def demo_batch_processing():
+def demo_batch_processing(streaming: bool = False):
     """
     Demo showing how to use batch processing for faster episode recording.
     
     The key insight from the GitHub issue is that setting video_encoding_batch_size > 1
     will defer video encoding until multiple episodes are recorded, significantly
     reducing per-episode processing time.
+
+    With streaming=True, videos are instead encoded in background threads while recording,
+    so save_episode() only waits for the last frames and there is no final flush. Batch sizes
+    are then ignored, so the comparison below is only meaningful with streaming=False.
     """
     
     logger.info("🚀 Starting batch processing demonstration")
@@ -40,6 +48,10 @@ def demo_batch_processing():
     
     # Key parameters for batch processing
     batch_encoding_sizes = [1, 5, 10]  # Compare different batch sizes
+    encoder_preset = 12  # libsvtav1 preset 12 is ~1.5x faster than the default with negligible quality loss
+
+    # Clean up previous test data once, instead of wiping the runs of this demo between batch sizes
+    shutil.rmtree(root, ignore_errors=True)
     
     for batch_size in batch_encoding_sizes:
         logger.info(f"\n📊 Testing with batch_encoding_size = {batch_size}")
@@ -47,58 +59,76 @@ def demo_batch_processing():
         # Create dataset with batch encoding
         features = {
             "observation.state": {"shape": (6,), "dtype": "float32"},
+            "observation.images.camera": {
+                "shape": (240, 320, 3),
+                "dtype": "video",
+                "names": ["height", "width", "channels"],
+            },
             "action": {"shape": (6,), "dtype": "float32"},
         }
         
-        # Clean up previous test data
-        import shutil
-        if root.exists():
-            shutil.rmtree(root)
+        # Each batch size records into its own subdirectory, so only that one needs cleaning
+        batch_root = root / f"batch_{batch_size}"
+        if batch_root.exists():
+            shutil.rmtree(batch_root, ignore_errors=True)
         
         # Create dataset with specified batch encoding size
         dataset = LeRobotDataset.create(
             repo_id=f"{repo_id}_{batch_size}",
             fps=fps,
-            root=root / f"batch_{batch_size}",
+            root=batch_root,
             robot_type="demo_robot",
             features=features,
             use_videos=True,  # Enable video recording
             batch_encoding_size=batch_size,  # Key parameter for batch processing
+            encoder_preset=encoder_preset,  # Faster libsvtav1 operating point
+            parallel_camera_encoding=True,  # One encoder worker per camera stream
+            streaming_encoding=streaming,  # Encode during recording, no PNG round-trip
         )
         
         logger.info(f"Created dataset with batch_encoding_size = {batch_size}")
         
         # Simulate recording multiple episodes
         num_episodes = 3
-        total_time = 0
+        episode_times = np.empty(num_episodes)
         
-        # Use VideoEncodingManager to handle batch encoding at the end
-        with VideoEncodingManager(dataset):
+        # Use VideoEncodingManager to handle batch encoding at the end (not needed when streaming)
+        encoding_manager = contextlib.nullcontext() if streaming else VideoEncodingManager(dataset)
+        with encoding_manager:
             for episode_idx in range(num_episodes):
-                start_time = time.time()
+                t0 = time.perf_counter_ns()
                 
                 logger.info(f"  📹 Recording episode {episode_idx + 1}/{num_episodes}")
                 
-                # Simulate recording 10 frames per episode
-                for _ in range(10):
-                    frame = {
-                        "observation.state": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
-                        "action": [0.5, 0.4, 0.3, 0.2, 0.1, 0.0],
+                # Simulate recording 10 frames per episode, pushed to the dataset in one call
+                frames = [
+                    {
+                        "observation.state": np.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6], dtype=np.float32),
+                        "observation.images.camera": np.zeros((240, 320, 3), dtype=np.uint8),
+                        "action": np.array([0.5, 0.4, 0.3, 0.2, 0.1, 0.0], dtype=np.float32),
                     }
-                    dataset.add_frame(frame, task="demo_task")
+                    for _ in range(10)
+                ]
+                dataset.add_frames(frames, task="demo_task")
                 
                 # Save episode - this is where the magic happens
                 # With batch_encoding_size > 1, video encoding is deferred
                 dataset.save_episode()
                 
-                episode_time = time.time() - start_time
-                total_time += episode_time
+                episode_time = (time.perf_counter_ns() - t0) / 1e9
+                episode_times[episode_idx] = episode_time
                 
                 logger.info(f"    ⏱️  Episode {episode_idx + 1} saved in {episode_time:.2f}s")
         
-        avg_time_per_episode = total_time / num_episodes
-        logger.info(f"  📈 Average time per episode: {avg_time_per_episode:.2f}s")
-        logger.info(f"  📊 Total time for {num_episodes} episodes: {total_time:.2f}s")
+        avg_time_per_episode = episode_times.mean()
+        logger.info(
+            f"  📈 Average time per episode: {avg_time_per_episode:.2f}s (± {episode_times.std():.2f}s)"
+        )
+        logger.info(f"  📊 Total time for {num_episodes} episodes: {episode_times.sum():.2f}s")
+        for camera_key, encoding_time in dataset.camera_encoding_times.items():
+            logger.info(f"  🎥 {camera_key} encoding time: {encoding_time:.2f}s")
+        video_sizes = [f.stat().st_size for f in (dataset.root / "videos").rglob("*.mp4")]
+        logger.info(f"  🗂️  {len(video_sizes)} video files, {np.mean(video_sizes or [0]) / 1e6:.2f} MB on average")
         
         # Show the improvement
         if batch_size == 1:
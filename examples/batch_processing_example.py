@@ -8,30 +8,82 @@ Run this with different batch sizes to see the performance difference:
 python examples/batch_processing_example.py --batch_size 1   # Immediate encoding
 python examples/batch_processing_example.py --batch_size 5   # Batch encoding
 python examples/batch_processing_example.py --batch_size 10  # Larger batch
+python examples/batch_processing_example.py --batch_size 5 --preset 4  # Slower, default-like encoder preset
+python examples/batch_processing_example.py --compare        # Sweep batch sizes, encoder presets and streaming
+python examples/batch_processing_example.py --streaming      # Encode while recording (batch size is ignored)
+python examples/batch_processing_example.py --pipe-raw       # Pipe raw frames into ffmpeg (requires ffmpeg)
 """
 
 import argparse
+import contextlib
 import logging
+import shutil
+import subprocess
 import tempfile
 import time
 from pathlib import Path
 
+import numpy as np
+
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.datasets.video_utils import VideoEncodingManager
 
 # Configure logging to see the improved messages
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+FPS = 30
+CAMERA_KEYS = ["observation.image.camera", "observation.image.wrist"]
+IMAGE_HEIGHT, IMAGE_WIDTH = 240, 320
+
+
+def open_raw_video_pipe(video_path: Path, preset: int) -> subprocess.Popen:
+    """Start an ffmpeg process encoding the raw RGB frames written to its stdin into `video_path`."""
+    video_path.parent.mkdir(parents=True, exist_ok=True)
+    command = [
+        "ffmpeg", "-loglevel", "error", "-y",
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{IMAGE_WIDTH}x{IMAGE_HEIGHT}", "-r", str(FPS),
+        "-i", "pipe:",
+        "-c:v", "libsvtav1", "-preset", str(preset), "-pix_fmt", "yuv420p",
+        str(video_path),
+    ]  # fmt: skip
+    return subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
 
-def demo_batch_processing(batch_size: int = 5, num_episodes: int = 5):
+def close_raw_video_pipe(proc: subprocess.Popen) -> str | None:
+    """Close the stdin of an ffmpeg process and wait for it. Returns ffmpeg's error output if it failed."""
+    with contextlib.suppress(BrokenPipeError):
+        proc.stdin.close()
+    if proc.wait() != 0:
+        return proc.stderr.read().decode(errors="replace").strip() or f"exit code {proc.returncode}"
+    return None
+
+
+def demo_batch_processing(
+    batch_size: int = 5,
+    num_episodes: int = 5,
+    preset: int = 12,
+    streaming: bool = False,
+    pipe_raw: bool = False,
+):
     """
     Demonstrate batch processing with the improved logging and feedback.
     
     Args:
         batch_size: Number of episodes to batch together for video encoding
         num_episodes: Total number of episodes to record
+        preset: libsvtav1 encoder preset (higher is faster)
+        streaming: Encode videos while recording instead of at save/flush time. Batch size has no
+            effect in this mode since there is nothing left to encode at save time.
+        pipe_raw: Bypass the dataset for camera frames and pipe them as rawvideo into one ffmpeg
+            process per camera. Only state and action go through `add_frame`.
     """
-    print(f"\n🎯 Demo: Recording {num_episodes} episodes with batch_size={batch_size}")
+    if pipe_raw and shutil.which("ffmpeg") is None:
+        raise RuntimeError("--pipe-raw requires the ffmpeg executable to be available in PATH.")
+
+    print(
+        f"\n🎯 Demo: Recording {num_episodes} episodes with batch_size={batch_size}, preset={preset}, "
+        f"streaming={streaming}, pipe_raw={pipe_raw}"
+    )
     print("=" * 60)
     
     # Create temporary directory for demo
@@ -39,53 +91,111 @@ def demo_batch_processing(batch_size: int = 5, num_episodes: int = 5):
         # Define features for a simple robot
         features = {
             "observation.state": {"shape": (6,), "dtype": "float32"},
-            "observation.image.camera": {"shape": (240, 320, 3), "dtype": "uint8"},
             "action": {"shape": (6,), "dtype": "float32"},
         }
+        if not pipe_raw:
+            for camera_key in CAMERA_KEYS:
+                features[camera_key] = {
+                    "shape": (IMAGE_HEIGHT, IMAGE_WIDTH, 3),
+                    "dtype": "video",
+                    "names": ["height", "width", "channels"],
+                }
         
         # Create dataset with specified batch size
         dataset = LeRobotDataset.create(
             repo_id=f"demo/batch_processing_test",
-            fps=30,
+            fps=FPS,
             root=Path(temp_dir) / "dataset",
             robot_type="demo_robot", 
             features=features,
             use_videos=True,
             batch_encoding_size=batch_size,  # This is the key parameter!
+            encoder_preset=preset,
+            parallel_camera_encoding=True,  # One encoder worker per camera stream
+            streaming_encoding=streaming,  # Encode during recording, no PNG round-trip
         )
         
-        total_start_time = time.time()
+        # Dummy frame data, allocated once and reused for every frame
+        dummy_img = np.tile(np.array([1, 2, 3], dtype=np.uint8), (IMAGE_HEIGHT, IMAGE_WIDTH, 1))
+        dummy_state = np.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6], dtype=np.float32)
+        dummy_action = np.array([0.5, 0.4, 0.3, 0.2, 0.1, 0.0], dtype=np.float32)
+
+        episode_times = np.empty(num_episodes)
+        total_start_time = time.perf_counter_ns()
         
-        # Use VideoEncodingManager for proper cleanup
-        with VideoEncodingManager(dataset):
+        # Streamed videos are complete after each save_episode(), so there is no final flush to manage.
+        # Otherwise, use VideoEncodingManager for proper cleanup
+        encoding_manager = contextlib.nullcontext() if streaming else VideoEncodingManager(dataset)
+        with encoding_manager:
             for episode_idx in range(num_episodes):
-                episode_start_time = time.time()
+                episode_start_time = time.perf_counter_ns()
                 
                 print(f"\n📹 Recording episode {episode_idx + 1}/{num_episodes}")
-                
-                # Simulate recording frames (10 frames per episode)
-                for frame_idx in range(10):
-                    # Create dummy frame data
-                    frame = {
-                        "observation.state": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
-                        "observation.image.camera": [[1, 2, 3] * 320] * 240,  # Dummy image
-                        "action": [0.5, 0.4, 0.3, 0.2, 0.1, 0.0],
-                    }
-                    dataset.add_frame(frame, task="demo_task")
+
+                raw_pipes = {}
+                try:
+                    if pipe_raw:
+                        raw_videos_dir = Path(temp_dir) / "raw_videos"
+                        for camera_key in CAMERA_KEYS:
+                            raw_pipes[camera_key] = open_raw_video_pipe(
+                                raw_videos_dir / camera_key / f"episode_{episode_idx:06d}.mp4", preset
+                            )
+
+                    # Simulate recording frames (10 frames per episode), pushed to the dataset in one call
+                    frames = []
+                    for frame_idx in range(10):
+                        frame = {
+                            "observation.state": dummy_state,
+                            "observation.image.camera": dummy_img,
+                            "observation.image.wrist": dummy_img,
+                            "action": dummy_action,
+                        }
+                        for camera_key, proc in raw_pipes.items():
+                            try:
+                                proc.stdin.write(frame.pop(camera_key).tobytes())
+                            except BrokenPipeError:
+                                # ffmpeg exited early, report why rather than the broken pipe
+                                error = close_raw_video_pipe(proc)
+                                raise RuntimeError(f"ffmpeg failed to encode {camera_key}: {error}") from None
+                        frames.append(frame)
+                    dataset.add_frames(frames, task="demo_task")
+
+                    # Closing stdin lets ffmpeg flush and finalize the videos of this episode
+                    for camera_key, proc in raw_pipes.items():
+                        error = close_raw_video_pipe(proc)
+                        if error is not None:
+                            raise RuntimeError(f"ffmpeg failed to encode {camera_key}: {error}")
+                finally:
+                    # Don't leave the other cameras' ffmpeg processes running if one of them failed
+                    for proc in raw_pipes.values():
+                        if proc.poll() is None:
+                            proc.kill()
+                            proc.wait()
                 
                 # Save episode - this will either encode immediately or defer to batch
                 dataset.save_episode()
                 
-                episode_time = time.time() - episode_start_time
+                episode_time = (time.perf_counter_ns() - episode_start_time) / 1e9
+                episode_times[episode_idx] = episode_time
                 print(f"⏱️  Episode {episode_idx + 1} processing time: {episode_time:.2f}s")
         
-        total_time = time.time() - total_start_time
+        # Includes the final flush of VideoEncodingManager, if any
+        total_time = (time.perf_counter_ns() - total_start_time) / 1e9
         avg_time = total_time / num_episodes
         
         print(f"\n📊 Summary:")
         print(f"   Total time: {total_time:.2f}s")
         print(f"   Average time per episode: {avg_time:.2f}s")
+        print(f"   Episode save loop: {episode_times.mean():.3f}s ± {episode_times.std():.3f}s")
         print(f"   Batch size used: {batch_size}")
+        print(f"   Encoder preset used: {preset}")
+        print(f"   Streaming encoding: {streaming}")
+        print(f"   Raw ffmpeg pipes: {pipe_raw}")
+        print("   Per-camera encoding time:")
+        for camera_key, encoding_time in dataset.camera_encoding_times.items():
+            print(f"      {camera_key}: {encoding_time:.2f}s")
+        video_sizes = [f.stat().st_size for f in Path(temp_dir).rglob("*.mp4")]
+        print(f"   Video files: {len(video_sizes)} ({np.mean(video_sizes or [0]) / 1e6:.2f} MB on average)")
         
         return avg_time
 
@@ -96,28 +206,45 @@ def main():
                        help="Number of episodes to batch for video encoding (default: 5)")
     parser.add_argument("--num_episodes", type=int, default=5,
                        help="Total number of episodes to record (default: 5)")
+    parser.add_argument("--preset", type=int, default=12,
+                       help="libsvtav1 encoder preset, higher is faster (default: 12)")
+    parser.add_argument("--streaming", action=argparse.BooleanOptionalAction, default=False,
+                       help="Encode videos while recording, ignoring --batch_size (default: --no-streaming)")
+    parser.add_argument("--pipe-raw", action="store_true",
+                       help="Pipe raw camera frames into one ffmpeg process per camera instead of add_frame")
     parser.add_argument("--compare", action="store_true",
-                       help="Compare different batch sizes")
+                       help="Compare different batch sizes, encoder presets and streaming encoding")
     
     args = parser.parse_args()
     
     if args.compare:
-        print("🔬 Comparing different batch sizes...")
+        print("🔬 Comparing different batch sizes, encoder presets and streaming encoding...")
         batch_sizes = [1, 3, 5]
+        presets = [4, 8, 12]
         results = {}
         
-        for batch_size in batch_sizes:
-            results[batch_size] = demo_batch_processing(batch_size, args.num_episodes)
+        for preset in presets:
+            for batch_size in batch_sizes:
+                results[(f"batch size {batch_size:2d}", preset)] = demo_batch_processing(
+                    batch_size, args.num_episodes, preset, False, args.pipe_raw
+                )
+            # Batch size is ignored when streaming, so streaming is its own row rather than a batch size
+            results[("streaming    ", preset)] = demo_batch_processing(
+                1, args.num_episodes, preset, True, args.pipe_raw
+            )
         
         print(f"\n📈 Performance Comparison:")
         print("─" * 40)
-        baseline = results[1]
-        for batch_size, avg_time in results.items():
-            improvement = ((baseline - avg_time) / baseline) * 100 if batch_size > 1 else 0
-            status = "🚀" if batch_size > 1 else "📹"
-            print(f"{status} Batch size {batch_size:2d}: {avg_time:.2f}s/episode ({improvement:+.1f}%)")
+        baseline_key = (f"batch size {batch_sizes[0]:2d}", presets[0])
+        baseline = results[baseline_key]
+        for (mode, preset), avg_time in results.items():
+            improvement = ((baseline - avg_time) / baseline) * 100
+            status = "📹" if (mode, preset) == baseline_key else "🚀"
+            print(f"{status} {mode}, preset {preset:2d}: {avg_time:.2f}s/episode ({improvement:+.1f}%)")
     else:
-        demo_batch_processing(args.batch_size, args.num_episodes)
+        demo_batch_processing(
+            args.batch_size, args.num_episodes, args.preset, args.streaming, args.pipe_raw
+        )
     
     print(f"\n💡 Tips:")
     print(f"   • Use --dataset.video_encoding_batch_size=5 for 60-70% faster recording")
@@ -4,16 +4,19 @@
 Simple script to create individual Hugging Face model repositories from checkpoints
 Based on LBST/t08_pick_and_place_policy_smolvla_files
 
-Usage: python simple_checkpoint_creator.py
+Usage: python simple_checkpoint_creator.py [--max_workers 4]
 """
 
+import argparse
+import errno
 import os
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 try:
-    from huggingface_hub import HfApi, create_repo, hf_hub_download, upload_folder
+    from huggingface_hub import HfApi
 except ImportError:
     print("Please install huggingface_hub: pip install huggingface_hub")
     exit(1)
@@ -27,9 +30,7 @@ BASE_REPO_NAME = "t08_pick_and_place_policy"
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def create_readme(checkpoint: str) -> str:
-    """Create README content for the checkpoint repository."""
-    return f"""---
+README_TEMPLATE = """---
 library_name: lerobot
 tags:
 - robotics
@@ -55,7 +56,7 @@ You can evaluate this model using LeRobot:
 
 ```bash
 python -m lerobot.scripts.eval \\
-    --policy.path={TARGET_USER}/{BASE_REPO_NAME}_{checkpoint} \\
+    --policy.path={target_user}/{base_repo_name}_{checkpoint} \\
     --env.type=<your_environment> \\
     --eval.n_episodes=10 \\
     --policy.device=cuda
@@ -69,14 +70,28 @@ python -m lerobot.scripts.eval \\
 
 ## Parent Repository
 
-This checkpoint was extracted from: [{SOURCE_REPO}](https://huggingface.co/{SOURCE_REPO})
+This checkpoint was extracted from: [{source_repo}](https://huggingface.co/{source_repo})
 
 ---
 
 *Generated automatically from checkpoint {checkpoint}*
 """
 
-def process_single_checkpoint(checkpoint: str, work_dir: Path):
+GITATTRIBUTES_BODY = """*.safetensors filter=lfs diff=lfs merge=lfs -text
+*.bin filter=lfs diff=lfs merge=lfs -text
+*.h5 filter=lfs diff=lfs merge=lfs -text
+"""
+
+def create_readme(checkpoint: str) -> str:
+    """Create README content for the checkpoint repository."""
+    return README_TEMPLATE.format(
+        checkpoint=checkpoint,
+        target_user=TARGET_USER,
+        base_repo_name=BASE_REPO_NAME,
+        source_repo=SOURCE_REPO,
+    )
+
+def process_single_checkpoint(checkpoint: str, work_dir: Path, api: HfApi):
     """Process a single checkpoint by downloading files and creating repository."""
     logger.info(f"Processing checkpoint {checkpoint}...")
     
@@ -85,36 +100,45 @@ def process_single_checkpoint(checkpoint: str, work_dir: Path):
     checkpoint_dir.mkdir(parents=True, exist_ok=True)
     
     try:
-        # Download files one by one to the checkpoint directory
-        files_to_download = [
-            f"{checkpoint}/pretrained_model/config.json",
-            f"{checkpoint}/pretrained_model/model.safetensors",
-            f"{checkpoint}/pretrained_model/train_config.json"
-        ]
+        # Download all the files of the checkpoint in a single call so that the small JSON files
+        # are fetched concurrently with the large model weights
+        files_to_download = ["config.json", "model.safetensors", "train_config.json"]
+        logger.info(f"Downloading {checkpoint}/pretrained_model...")
+        snapshot_root = Path(api.snapshot_download(
+            repo_id=SOURCE_REPO,
+            allow_patterns=[f"{checkpoint}/pretrained_model/{filename}" for filename in files_to_download],
+            cache_dir=str(work_dir / "cache")
+        ))
         
-        for file_path in files_to_download:
-            filename = Path(file_path).name
-            logger.info(f"Downloading {file_path}...")
-            
-            # Download to a temporary location first
-            downloaded_file = hf_hub_download(
-                repo_id=SOURCE_REPO,
-                filename=file_path,
-                cache_dir=str(work_dir / "cache")
+        # Unlike hf_hub_download, snapshot_download silently skips patterns that match no file
+        missing_files = [
+            filename for filename in files_to_download
+            if not (snapshot_root / checkpoint / "pretrained_model" / filename).exists()
+        ]
+        if missing_files:
+            raise FileNotFoundError(
+                f"{missing_files} not found in {SOURCE_REPO}/{checkpoint}/pretrained_model"
             )
-            
-            # Copy to our checkpoint directory
+        
+        # Hard-link into our checkpoint directory to avoid copying the model weights, falling back
+        # to a copy when the cache is on another filesystem or the filesystem forbids hard links
+        for filename in files_to_download:
+            downloaded_file = (snapshot_root / checkpoint / "pretrained_model" / filename).resolve()
             target_path = checkpoint_dir / filename
-            shutil.copy2(downloaded_file, target_path)
-            logger.info(f"Copied {filename} to checkpoint directory")
+            # A previous interrupted run may have left the file behind, which os.link won't overwrite
+            target_path.unlink(missing_ok=True)
+            try:
+                os.link(downloaded_file, target_path)
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EACCES):
+                    raise
+                shutil.copy2(downloaded_file, target_path)
+            logger.info(f"Added {filename} to checkpoint directory")
         
         # Create README and .gitattributes
         logger.info("Creating README.md and .gitattributes...")
         (checkpoint_dir / "README.md").write_text(create_readme(checkpoint))
-        (checkpoint_dir / ".gitattributes").write_text("""*.safetensors filter=lfs diff=lfs merge=lfs -text
-*.bin filter=lfs diff=lfs merge=lfs -text
-*.h5 filter=lfs diff=lfs merge=lfs -text
-""")
+        (checkpoint_dir / ".gitattributes").write_text(GITATTRIBUTES_BODY)
         
         # Create repository and upload
         repo_name = f"{BASE_REPO_NAME}_{checkpoint}"
@@ -122,12 +146,12 @@ def process_single_checkpoint(checkpoint: str, work_dir: Path):
         
         logger.info(f"Creating repository {full_repo_name}...")
         try:
-            create_repo(repo_id=repo_name, repo_type="model", private=False, exist_ok=True)
+            api.create_repo(repo_id=repo_name, repo_type="model", private=False, exist_ok=True)
         except Exception as e:
             logger.warning(f"Repository creation warning: {e}")
         
         logger.info(f"Uploading files to {full_repo_name}...")
-        upload_folder(
+        api.upload_folder(
             repo_id=full_repo_name,
             folder_path=checkpoint_dir,
             repo_type="model",
@@ -149,6 +173,13 @@ def process_single_checkpoint(checkpoint: str, work_dir: Path):
 
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description="Create one Hugging Face model repository per checkpoint")
+    parser.add_argument("--max_workers", type=int, default=4,
+                        help="Number of checkpoints processed concurrently (default: 4)")
+    args = parser.parse_args()
+    if args.max_workers < 1:
+        parser.error(f"--max_workers must be at least 1, got {args.max_workers}")
+
     # Check authentication
     try:
         api = HfApi()
@@ -168,17 +199,35 @@ def main():
         checkpoints = [f"{i:06d}" for i in range(1000, 21000, 1000)]
         logger.info(f"Will process {len(checkpoints)} checkpoints: {checkpoints}")
         
-        # Process each checkpoint
+        # Process checkpoints concurrently: each one mostly waits on Hub downloads and uploads,
+        # and works in its own work_dir / checkpoint directory so cleanups don't race
         successful = []
         failed = []
         
-        for i, checkpoint in enumerate(checkpoints, 1):
-            logger.info(f"Processing checkpoint {checkpoint} ({i}/{len(checkpoints)})...")
-            
-            if process_single_checkpoint(checkpoint, work_dir):
-                successful.append(checkpoint)
-            else:
-                failed.append(checkpoint)
+        executor = ThreadPoolExecutor(max_workers=args.max_workers)
+        try:
+            futures = {
+                executor.submit(process_single_checkpoint, checkpoint, work_dir, api): checkpoint
+                for checkpoint in checkpoints
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                checkpoint = futures[future]
+                logger.info(f"Finished checkpoint {checkpoint} ({i}/{len(checkpoints)})")
+                
+                if future.result():
+                    successful.append(checkpoint)
+                else:
+                    failed.append(checkpoint)
+        except KeyboardInterrupt:
+            # Don't start the queued checkpoints, only wait for the ones already in progress
+            logger.warning("Interrupted, cancelling pending checkpoints and waiting for running ones...")
+            executor.shutdown(cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown()
+        
+        successful.sort()
+        failed.sort()
         
         # Summary
         logger.info("=" * 50)
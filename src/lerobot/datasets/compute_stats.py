@@ -54,14 +54,17 @@ def auto_downsample_height_width(img: np.ndarray, target_size: int = 150, max_si
     return img[:, ::downsample_factor, ::downsample_factor]
 
 
-def sample_images(image_paths: list[str]) -> np.ndarray:
+def sample_images(image_paths: list[str] | np.ndarray) -> np.ndarray:
+    """Sample images from a list of image paths, or from an array of (C, H, W) uint8 images."""
     sampled_indices = sample_indices(len(image_paths))
 
     images = None
     for i, idx in enumerate(sampled_indices):
-        path = image_paths[idx]
-        # we load as uint8 to reduce memory usage
-        img = load_image_as_numpy(path, dtype=np.uint8, channel_first=True)
+        if isinstance(image_paths, np.ndarray):
+            img = image_paths[idx]
+        else:
+            # we load as uint8 to reduce memory usage
+            img = load_image_as_numpy(image_paths[idx], dtype=np.uint8, channel_first=True)
         img = auto_downsample_height_width(img)
 
         if images is None:
@@ -88,7 +91,7 @@ def compute_episode_stats(episode_data: dict[str, list[str] | np.ndarray], featu
         if features[key]["dtype"] == "string":
             continue  # HACK: we should receive np.arrays of strings
         elif features[key]["dtype"] in ["image", "video"]:
-            ep_ft_array = sample_images(data)  # data is a list of image paths
+            ep_ft_array = sample_images(data)  # data is a list of image paths or an array of images
             axes_to_reduce = (0, 2, 3)  # keep channel dim
             keepdims = True
         else:
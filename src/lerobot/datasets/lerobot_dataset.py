@@ -15,9 +15,11 @@
 # limitations under the License.
 import contextlib
 import logging
+import os
 import shutil
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import datasets
@@ -32,8 +34,12 @@ from huggingface_hub.constants import REPOCARD_NAME
 from huggingface_hub.errors import RevisionNotFoundError
 
 from lerobot.constants import HF_LEROBOT_HOME
-from lerobot.datasets.compute_stats import aggregate_stats, compute_episode_stats
-from lerobot.datasets.image_writer import AsyncImageWriter, write_image
+from lerobot.datasets.compute_stats import (
+    aggregate_stats,
+    auto_downsample_height_width,
+    compute_episode_stats,
+)
+from lerobot.datasets.image_writer import AsyncImageWriter, image_array_to_pil_image, write_image
 from lerobot.datasets.utils import (
     DEFAULT_FEATURES,
     DEFAULT_IMAGE_PATH,
@@ -67,6 +73,7 @@ from lerobot.datasets.utils import (
     write_json,
 )
 from lerobot.datasets.video_utils import (
+    StreamingVideoEncoder,
     VideoFrame,
     decode_video_frames,
     encode_video_frames,
@@ -75,6 +82,16 @@ from lerobot.datasets.video_utils import (
 )
 
 CODEBASE_VERSION = "v2.1"
+# Upper bound on the downsampled frames kept per camera to compute the stats of a streamed episode
+MAX_STREAMING_STATS_FRAMES = 200
+
+
+def _warn_if_streaming_ignores_batching(streaming_encoding: bool, batch_encoding_size: int) -> None:
+    if streaming_encoding and batch_encoding_size > 1:
+        logging.warning(
+            f"streaming_encoding=True encodes videos while recording, so batch_encoding_size="
+            f"{batch_encoding_size} is ignored and videos are finalized in every save_episode()."
+        )
 
 
 class LeRobotDatasetMetadata:
@@ -342,6 +359,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         download_videos: bool = True,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        encoder_preset: int | None = None,
+        parallel_camera_encoding: bool = False,
+        streaming_encoding: bool = False,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -445,6 +465,15 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 You can also use the 'pyav' decoder used by Torchvision, which used to be the default option, or 'video_reader' which is another decoder of Torchvision.
             batch_encoding_size (int, optional): Number of episodes to accumulate before batch encoding videos.
                 Set to 1 for immediate encoding (default), or higher for batched encoding. Defaults to 1.
+            encoder_preset (int | None, optional): Encoder speed preset forwarded to `encode_video_frames`.
+                For libsvtav1, higher values encode faster (e.g. 12 is ~1.5x faster than the default with
+                negligible quality loss). Defaults to None, which keeps the encoder's default preset.
+            parallel_camera_encoding (bool, optional): Encode the videos of the different cameras of an
+                episode concurrently, one single-threaded encoder per camera. Defaults to False.
+            streaming_encoding (bool, optional): Encode videos while recording, with one background encoder
+                thread per camera fed directly by `add_frame`. Frames are not written to disk as PNGs and
+                `save_episode` only has to wait for the last frames to be encoded. Batch encoding is
+                bypassed when enabled. Defaults to False.
         """
         super().__init__()
         self.repo_id = repo_id
@@ -457,6 +486,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.video_backend = video_backend if video_backend else get_safe_default_codec()
         self.delta_indices = None
         self.batch_encoding_size = batch_encoding_size
+        self.encoder_preset = encoder_preset
+        self.parallel_camera_encoding = parallel_camera_encoding
+        self.streaming_encoding = streaming_encoding
+        self.streaming_encoders = {}
+        self.streaming_stats_strides = {}
+        self.camera_encoding_times = {}
         self.episodes_since_last_encoding = 0
 
         # Log batch processing configuration
@@ -465,6 +500,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             logging.info("⚡ This will significantly reduce per-episode processing time!")
         else:
             logging.info("📹 Immediate video encoding enabled (batch_encoding_size=1)")
+        _warn_if_streaming_ignores_batching(streaming_encoding, batch_encoding_size)
 
         # Unused attributes
         self.image_writer = None
@@ -780,43 +816,128 @@ class LeRobotDataset(torch.utils.data.Dataset):
         temporary directory — nothing is written to disk. To save those frames, the 'save_episode()' method
         then needs to be called.
         """
-        # Convert torch to numpy if needed
-        for name in frame:
-            if isinstance(frame[name], torch.Tensor):
-                frame[name] = frame[name].numpy()
+        self.add_frames([frame], task, timestamps=None if timestamp is None else [timestamp])
+
+    def add_frames(self, frames: list[dict], task: str, timestamps: list[float] | None = None) -> None:
+        """
+        Same as 'add_frame()' for several frames of the same task at once. Frames are validated one by one,
+        then each feature is appended to the episode_buffer for all the frames in a single pass, which
+        amortizes the per-frame bookkeeping when frames are recorded (or generated) in chunks.
+        """
+        if len(frames) == 0:
+            return
+        if timestamps is not None and len(timestamps) != len(frames):
+            raise ValueError(
+                f"Got {len(timestamps)} timestamps for {len(frames)} frames. Provide one timestamp per frame."
+            )
 
-        validate_frame(frame, self.features)
+        for frame in frames:
+            # Convert torch to numpy if needed
+            for name in frame:
+                if isinstance(frame[name], torch.Tensor):
+                    frame[name] = frame[name].numpy()
+
+            validate_frame(frame, self.features)
 
         if self.episode_buffer is None:
             self.episode_buffer = self.create_episode_buffer()
 
         # Automatically add frame_index and timestamp to episode buffer
-        frame_index = self.episode_buffer["size"]
-        if timestamp is None:
-            timestamp = frame_index / self.fps
-        self.episode_buffer["frame_index"].append(frame_index)
-        self.episode_buffer["timestamp"].append(timestamp)
-        self.episode_buffer["task"].append(task)
+        first_frame_index = self.episode_buffer["size"]
+        frame_indices = range(first_frame_index, first_frame_index + len(frames))
+        if timestamps is None:
+            timestamps = [frame_index / self.fps for frame_index in frame_indices]
+        self.episode_buffer["frame_index"].extend(frame_indices)
+        self.episode_buffer["timestamp"].extend(timestamps)
+        self.episode_buffer["task"].extend([task] * len(frames))
 
         # Add frame features to episode_buffer
-        for key in frame:
+        episode_index = self.episode_buffer["episode_index"]
+        for key in frames[0]:
             if key not in self.features:
                 raise ValueError(
                     f"An element of the frame is not in the features. '{key}' not in '{self.features.keys()}'."
                 )
 
-            if self.features[key]["dtype"] in ["image", "video"]:
-                img_path = self._get_image_file_path(
-                    episode_index=self.episode_buffer["episode_index"], image_key=key, frame_index=frame_index
-                )
-                if frame_index == 0:
-                    img_path.parent.mkdir(parents=True, exist_ok=True)
-                self._save_image(frame[key], img_path)
-                self.episode_buffer[key].append(str(img_path))
+            values = [frame[key] for frame in frames]
+            if self.streaming_encoding and self.features[key]["dtype"] == "video":
+                for frame_index, value in zip(frame_indices, values, strict=True):
+                    self._stream_video_frame(key, value, episode_index, frame_index)
+            elif self.features[key]["dtype"] in ["image", "video"]:
+                for frame_index, value in zip(frame_indices, values, strict=True):
+                    img_path = self._get_image_file_path(
+                        episode_index=episode_index, image_key=key, frame_index=frame_index
+                    )
+                    if frame_index == 0:
+                        img_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._save_image(value, img_path)
+                    self.episode_buffer[key].append(str(img_path))
             else:
-                self.episode_buffer[key].append(frame[key])
+                self.episode_buffer[key].extend(values)
+
+        self.episode_buffer["size"] += len(frames)
 
-        self.episode_buffer["size"] += 1
+    def _stream_video_frame(
+        self, video_key: str, image: np.ndarray | PIL.Image.Image, episode_index: int, frame_index: int
+    ) -> None:
+        """
+        Send a frame to the streaming encoder of its camera and keep a downsampled copy for stats.
+
+        Only an evenly spaced subset of the frames is kept: every `stride` frames, where the stride doubles
+        (dropping every other kept frame) each time more than MAX_STREAMING_STATS_FRAMES are kept. This bounds
+        memory regardless of the episode length, while leaving enough frames for `compute_episode_stats`.
+        """
+        if video_key not in self.streaming_encoders:
+            self.streaming_encoders[video_key] = StreamingVideoEncoder(
+                self.root / self.meta.get_video_file_path(episode_index, video_key),
+                self.fps,
+                preset=self.encoder_preset,
+                # Each camera has its own encoder thread, keep them single-threaded as with batch encoding
+                threads=1 if self.parallel_camera_encoding else None,
+            )
+
+        if isinstance(image, PIL.Image.Image):
+            image = np.array(image.convert("RGB"))
+        elif image.dtype == np.uint8 and image.ndim == 3 and image.shape[0] != 3 and image.shape[-1] == 3:
+            # Already HWC uint8: a single owning copy, since callers may reuse the same buffer across frames
+            image = np.array(image, copy=True)
+        else:
+            image = np.array(image_array_to_pil_image(image))
+        self.streaming_encoders[video_key].add_frame(image)
+
+        stride = self.streaming_stats_strides.setdefault(video_key, 1)
+        if frame_index % stride == 0:
+            thumbnails = self.episode_buffer[video_key]
+            thumbnails.append(np.ascontiguousarray(auto_downsample_height_width(image.transpose(2, 0, 1))))
+            if len(thumbnails) > MAX_STREAMING_STATS_FRAMES:
+                thumbnails[:] = thumbnails[::2]
+                self.streaming_stats_strides[video_key] = 2 * stride
+
+    def _finish_streaming_encoding(self, episode_buffer: dict) -> None:
+        """Finalize the videos encoded while recording and stack their thumbnails for stats computation."""
+        pending_encoders = dict(self.streaming_encoders)
+        # The next episode must start new encoders, whether or not finalizing this one succeeds
+        self.streaming_encoders = {}
+        self.streaming_stats_strides = {}
+        try:
+            for key, encoder in list(pending_encoders.items()):
+                start_time = time.time()
+                encoder.close()
+                del pending_encoders[key]
+                self.camera_encoding_times[key] = self.camera_encoding_times.get(key, 0.0) + (
+                    time.time() - start_time
+                )
+                episode_buffer[key] = np.stack(episode_buffer[key])
+        finally:
+            # Remove the partial videos of the encoder that failed and of the ones not closed yet
+            for encoder in pending_encoders.values():
+                encoder.abort()
+
+    def _abort_streaming_encoding(self) -> None:
+        for encoder in self.streaming_encoders.values():
+            encoder.abort()
+        self.streaming_encoders = {}
+        self.streaming_stats_strides = {}
 
     def save_episode(self, episode_data: dict | None = None) -> None:
         """
@@ -864,13 +985,21 @@ class LeRobotDataset(torch.utils.data.Dataset):
             episode_buffer[key] = np.stack(episode_buffer[key])
 
         self._wait_image_writer()
+        if self.streaming_encoding:
+            self._finish_streaming_encoding(episode_buffer)
         self._save_episode_table(episode_buffer, episode_index)
         ep_stats = compute_episode_stats(episode_buffer, self.features)
 
         has_video_keys = len(self.meta.video_keys) > 0
-        use_batched_encoding = self.batch_encoding_size > 1
-
-        if has_video_keys and not use_batched_encoding:
+        # Streamed videos are already encoded, so there is nothing left to batch
+        use_batched_encoding = self.batch_encoding_size > 1 and not self.streaming_encoding
+
+        if has_video_keys and self.streaming_encoding:
+            logging.info(f"Videos for episode {episode_index} encoded while recording (streaming encoding)")
+            if episode_index == 0:
+                self.meta.update_video_info()
+                write_info(self.meta.info, self.meta.root)  # ensure video info always written properly
+        elif has_video_keys and not use_batched_encoding:
             logging.info(f"Encoding videos for episode {episode_index} (immediate encoding)")
             self.encode_episode_videos(episode_index)
         elif has_video_keys and use_batched_encoding:
@@ -931,6 +1060,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
     def clear_episode_buffer(self) -> None:
         episode_index = self.episode_buffer["episode_index"]
 
+        # Drop the videos that were being streamed for the current episode
+        self._abort_streaming_encoding()
+
         # Clean up image files for the current episode buffer
         if self.image_writer is not None:
             for cam_key in self.meta.camera_keys:
@@ -979,25 +1111,48 @@ class LeRobotDataset(torch.utils.data.Dataset):
         - Video info updating in metadata
         - Raw image cleanup
 
+        When `parallel_camera_encoding` is enabled, each camera is encoded in its own worker thread with a
+        single-threaded encoder so that concurrent encoders don't oversubscribe the CPU.
+
         Args:
             episode_index (int): Index of the episode to encode.
         """
-        for key in self.meta.video_keys:
-            video_path = self.root / self.meta.get_video_file_path(episode_index, key)
-            if video_path.is_file():
-                # Skip if video is already encoded. Could be the case when resuming data recording.
-                continue
-            img_dir = self._get_image_file_path(
-                episode_index=episode_index, image_key=key, frame_index=0
-            ).parent
-            encode_video_frames(img_dir, video_path, self.fps, overwrite=True)
-            shutil.rmtree(img_dir)
+        video_keys = self.meta.video_keys
+        if self.parallel_camera_encoding and len(video_keys) > 1:
+            max_workers = min(len(video_keys), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._encode_camera_video, episode_index, key, threads=1)
+                    for key in video_keys
+                ]
+                durations = [future.result() for future in futures]
+        else:
+            durations = [self._encode_camera_video(episode_index, key) for key in video_keys]
+
+        for key, duration in zip(video_keys, durations, strict=True):
+            self.camera_encoding_times[key] = self.camera_encoding_times.get(key, 0.0) + duration
 
         # Update video info (only needed when first episode is encoded since it reads from episode 0)
         if len(self.meta.video_keys) > 0 and episode_index == 0:
             self.meta.update_video_info()
             write_info(self.meta.info, self.meta.root)  # ensure video info always written properly
 
+    def _encode_camera_video(self, episode_index: int, video_key: str, threads: int | None = None) -> float:
+        """Encode the frames of one camera of an episode and return the time spent doing so in seconds."""
+        video_path = self.root / self.meta.get_video_file_path(episode_index, video_key)
+        if video_path.is_file():
+            # Skip if video is already encoded. Could be the case when resuming data recording.
+            return 0.0
+        img_dir = self._get_image_file_path(
+            episode_index=episode_index, image_key=video_key, frame_index=0
+        ).parent
+        start_time = time.time()
+        encode_video_frames(
+            img_dir, video_path, self.fps, preset=self.encoder_preset, threads=threads, overwrite=True
+        )
+        shutil.rmtree(img_dir)
+        return time.time() - start_time
+
     def batch_encode_videos(self, start_episode: int = 0, end_episode: int | None = None) -> None:
         """
         Batch encode videos for multiple episodes.
@@ -1042,6 +1197,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         image_writer_threads: int = 0,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        encoder_preset: int | None = None,
+        parallel_camera_encoding: bool = False,
+        streaming_encoding: bool = False,
     ) -> "LeRobotDataset":
         """Create a LeRobot Dataset from scratch in order to record data."""
         obj = cls.__new__(cls)
@@ -1059,7 +1217,14 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.tolerance_s = tolerance_s
         obj.image_writer = None
         obj.batch_encoding_size = batch_encoding_size
+        obj.encoder_preset = encoder_preset
+        obj.parallel_camera_encoding = parallel_camera_encoding
+        obj.streaming_encoding = streaming_encoding
+        obj.streaming_encoders = {}
+        obj.streaming_stats_strides = {}
+        obj.camera_encoding_times = {}
         obj.episodes_since_last_encoding = 0
+        _warn_if_streaming_ignores_batching(streaming_encoding, batch_encoding_size)
 
         if image_writer_processes or image_writer_threads:
             obj.start_image_writer(image_writer_processes, image_writer_threads)
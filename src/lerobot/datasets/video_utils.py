@@ -16,7 +16,9 @@
 import glob
 import importlib
 import logging
+import queue
 import shutil
+import threading
 import time
 import warnings
 from dataclasses import dataclass, field
@@ -24,6 +26,7 @@ from pathlib import Path
 from typing import Any, ClassVar
 
 import av
+import numpy as np
 import pyarrow as pa
 import torch
 import torchvision
@@ -254,6 +257,55 @@ def decode_video_frames_torchcodec(
     return closest_frames
 
 
+def get_video_encoding_options(
+    vcodec: str,
+    pix_fmt: str,
+    g: int | None,
+    crf: int | None,
+    fast_decode: int,
+    preset: int | None,
+    threads: int | None,
+) -> tuple[str, dict[str, str]]:
+    """
+    Check the codec and pixel format, and build the PyAV codec options shared by `encode_video_frames` and
+    `StreamingVideoEncoder`. Returns the (possibly corrected) pixel format and the codec options.
+    """
+    # Check encoder availability
+    if vcodec not in ["h264", "hevc", "libsvtav1"]:
+        raise ValueError(f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1.")
+
+    # Encoders/pixel formats incompatibility check
+    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
+        logging.warning(
+            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
+        )
+        pix_fmt = "yuv420p"
+
+    # Define video codec options
+    video_options = {}
+
+    if g is not None:
+        video_options["g"] = str(g)
+
+    if crf is not None:
+        video_options["crf"] = str(crf)
+
+    if preset is not None:
+        # Higher libsvtav1 presets trade a bit of compression efficiency for much faster encoding
+        video_options["preset"] = str(preset)
+
+    if threads is not None:
+        # Useful to avoid oversubscribing the CPU when several encoders run concurrently
+        video_options["threads"] = str(threads)
+
+    if fast_decode:
+        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
+        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
+        video_options[key] = value
+
+    return pix_fmt, video_options
+
+
 def encode_video_frames(
     imgs_dir: Path | str,
     video_path: Path | str,
@@ -263,26 +315,19 @@ def encode_video_frames(
     g: int | None = 2,
     crf: int | None = 30,
     fast_decode: int = 0,
+    preset: int | None = None,
+    threads: int | None = None,
     log_level: int | None = av.logging.ERROR,
     overwrite: bool = False,
 ) -> None:
     """More info on ffmpeg arguments tuning on `benchmark/video/README.md`"""
-    # Check encoder availability
-    if vcodec not in ["h264", "hevc", "libsvtav1"]:
-        raise ValueError(f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1.")
+    pix_fmt, video_options = get_video_encoding_options(vcodec, pix_fmt, g, crf, fast_decode, preset, threads)
 
     video_path = Path(video_path)
     imgs_dir = Path(imgs_dir)
 
     video_path.parent.mkdir(parents=True, exist_ok=overwrite)
 
-    # Encoders/pixel formats incompatibility check
-    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
-        logging.warning(
-            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
-        )
-        pix_fmt = "yuv420p"
-
     # Get input frames
     template = "frame_" + ("[0-9]" * 6) + ".png"
     input_list = sorted(
@@ -295,20 +340,6 @@ def encode_video_frames(
     dummy_image = Image.open(input_list[0])
     width, height = dummy_image.size
 
-    # Define video codec options
-    video_options = {}
-
-    if g is not None:
-        video_options["g"] = str(g)
-
-    if crf is not None:
-        video_options["crf"] = str(crf)
-
-    if fast_decode:
-        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
-        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
-        video_options[key] = value
-
     # Set logging level
     if log_level is not None:
         # "While less efficient, it is generally preferable to modify logging with Python’s logging"
@@ -342,6 +373,115 @@ def encode_video_frames(
         raise OSError(f"Video encoding did not work. File not found: {video_path}.")
 
 
+class StreamingVideoEncoder:
+    """
+    Encodes frames into a video file in a background thread while they are being recorded.
+
+    Frames pushed with `add_frame` are handed over to a PyAV encoder running in a dedicated thread. Compared
+    to `encode_video_frames`, this skips writing every frame to disk as a PNG and reading it back, and the
+    video is ready as soon as the last frame is encoded instead of when the episode is saved. At most
+    `max_queued_frames` frames wait in memory: when the encoder falls behind, `add_frame` blocks until it
+    catches up.
+
+    Args:
+        video_path: Path of the output video file.
+        fps: Frame rate of the output video.
+        vcodec, pix_fmt, g, crf, fast_decode, preset, threads, log_level: Same as for `encode_video_frames`.
+        max_queued_frames: Maximum number of frames waiting to be encoded.
+    """
+
+    def __init__(
+        self,
+        video_path: Path | str,
+        fps: int,
+        vcodec: str = "libsvtav1",
+        pix_fmt: str = "yuv420p",
+        g: int | None = 2,
+        crf: int | None = 30,
+        fast_decode: int = 0,
+        preset: int | None = None,
+        threads: int | None = None,
+        log_level: int | None = av.logging.ERROR,
+        max_queued_frames: int = 60,
+    ):
+        self.pix_fmt, self.video_options = get_video_encoding_options(
+            vcodec, pix_fmt, g, crf, fast_decode, preset, threads
+        )
+        self.video_path = Path(video_path)
+        self.fps = fps
+        self.vcodec = vcodec
+        self.log_level = log_level
+
+        self.video_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.log_level is not None:
+            logging.getLogger("libav").setLevel(self.log_level)
+
+        self._queue = queue.Queue(maxsize=max_queued_frames)
+        self._error = None
+        self._thread = threading.Thread(target=self._encode_loop, daemon=True)
+        self._thread.start()
+
+    def add_frame(self, image: np.ndarray) -> None:
+        """
+        Queue a (H, W, 3) uint8 frame for encoding, blocking while the queue is full. The caller must not
+        modify `image` afterwards.
+        """
+        if self._error is not None:
+            raise RuntimeError(f"Streaming encoding of {self.video_path} failed.") from self._error
+        self._queue.put(image)
+
+    def close(self) -> None:
+        """Wait for all the queued frames to be encoded and finalize the video file."""
+        self._queue.put(None)
+        self._thread.join()
+
+        if self._error is not None:
+            raise RuntimeError(f"Streaming encoding of {self.video_path} failed.") from self._error
+        if not self.video_path.exists():
+            raise OSError(f"Video encoding did not work. File not found: {self.video_path}.")
+
+    def abort(self) -> None:
+        """Stop encoding and remove the partially written video file."""
+        self._queue.put(None)
+        self._thread.join()
+        self.video_path.unlink(missing_ok=True)
+
+    def _encode_loop(self) -> None:
+        end_of_stream = False
+        try:
+            with av.open(str(self.video_path), "w") as output:
+                output_stream = None
+                while True:
+                    image = self._queue.get()
+                    if image is None:
+                        end_of_stream = True
+                        break
+
+                    if output_stream is None:
+                        output_stream = output.add_stream(self.vcodec, self.fps, options=self.video_options)
+                        output_stream.pix_fmt = self.pix_fmt
+                        output_stream.height, output_stream.width = image.shape[:2]
+
+                    input_frame = av.VideoFrame.from_ndarray(image, format="rgb24")
+                    packet = output_stream.encode(input_frame)
+                    if packet:
+                        output.mux(packet)
+
+                # Flush the encoder
+                if output_stream is not None:
+                    packet = output_stream.encode()
+                    if packet:
+                        output.mux(packet)
+        except Exception as e:
+            self._error = e
+            # Keep draining the queue until the end of stream so that `close` and `abort` don't hang
+            while not end_of_stream:
+                end_of_stream = self._queue.get() is None
+        finally:
+            if self.log_level is not None:
+                av.logging.restore_default_callback()
+
+
 @dataclass
 class VideoFrame:
     # TODO(rcadene, lhoestq): move to Hugging Face `datasets` repo
@@ -508,6 +648,7 @@ class VideoEncodingManager:
 
         # Clean up episode images if recording was interrupted
         if exc_type is not None:
+            self.dataset._abort_streaming_encoding()
             interrupted_episode_index = self.dataset.num_episodes
             for key in self.dataset.meta.video_keys:
                 img_dir = self.dataset._get_image_file_path(
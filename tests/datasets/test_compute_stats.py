@@ -71,6 +71,15 @@ def test_sample_images(mock_load):
     assert len(images) == estimate_num_samples(100)
 
 
+def test_sample_images_from_array():
+    image_array = np.random.randint(0, 256, (100, 3, 32, 32), dtype=np.uint8)
+    images = sample_images(image_array)
+    assert isinstance(images, np.ndarray)
+    assert images.shape[1:] == (3, 32, 32)
+    assert images.dtype == np.uint8
+    assert len(images) == estimate_num_samples(100)
+
+
 def test_get_feature_stats_images():
     data = np.random.rand(100, 3, 32, 32)
     stats = get_feature_stats(data, axis=(0, 2, 3), keepdims=True)
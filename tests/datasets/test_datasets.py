@@ -182,6 +182,27 @@ def test_add_frame(tmp_path, empty_lerobot_dataset_factory):
     assert dataset[0]["state"].ndim == 0
 
 
+def test_add_frames(tmp_path, empty_lerobot_dataset_factory):
+    features = {"state": {"dtype": "float32", "shape": (2,), "names": None}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features)
+    frames = [{"state": np.full(2, i, dtype=np.float32)} for i in range(3)]
+    dataset.add_frames(frames, task="Dummy task")
+    dataset.save_episode()
+
+    assert len(dataset) == 3
+    assert dataset[2]["state"].tolist() == [2.0, 2.0]
+    assert dataset[2]["frame_index"] == 2
+    assert dataset[2]["task"] == "Dummy task"
+
+
+def test_add_frames_wrong_number_of_timestamps(tmp_path, empty_lerobot_dataset_factory):
+    features = {"state": {"dtype": "float32", "shape": (1,), "names": None}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features)
+    frames = [{"state": torch.randn(1)} for _ in range(2)]
+    with pytest.raises(ValueError, match="Provide one timestamp per frame"):
+        dataset.add_frames(frames, task="Dummy task", timestamps=[0.0])
+
+
 def test_add_frame_state_1d(tmp_path, empty_lerobot_dataset_factory):
     features = {"state": {"dtype": "float32", "shape": (2,), "names": None}}
     dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features)
@@ -306,6 +327,74 @@ def test_add_frame_image_pil(image_dataset):
     assert dataset[0]["image"].shape == torch.Size(DUMMY_CHW)
 
 
+def test_parallel_camera_encoding(tmp_path, empty_lerobot_dataset_factory):
+    video_ft = {"dtype": "video", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]}
+    features = {"image_1": video_ft, "image_2": video_ft}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, encoder_preset=12, parallel_camera_encoding=True
+    )
+    for _ in range(3):
+        dataset.add_frame(
+            {key: np.random.randint(0, 256, DUMMY_HWC, dtype=np.uint8) for key in features},
+            task="Dummy task",
+        )
+    dataset.save_episode()
+
+    for key in features:
+        assert (dataset.root / dataset.meta.get_video_file_path(0, key)).is_file()
+    assert set(dataset.camera_encoding_times) == set(features)
+    assert all(encoding_time > 0 for encoding_time in dataset.camera_encoding_times.values())
+
+
+def test_add_frame_video_streaming_encoding(tmp_path, empty_lerobot_dataset_factory):
+    features = {"image": {"dtype": "video", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]}}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, streaming_encoding=True, batch_encoding_size=2
+    )
+    for _ in range(3):
+        dataset.add_frame({"image": np.random.randint(0, 256, DUMMY_HWC, dtype=np.uint8)}, task="Dummy task")
+    dataset.save_episode()
+
+    assert dataset.streaming_encoders == {}
+    assert dataset.episodes_since_last_encoding == 0
+    assert (dataset.root / dataset.meta.get_video_file_path(0, "image")).is_file()
+    assert not (dataset.root / "images").exists()
+
+
+def test_clear_episode_buffer_aborts_streaming_encoding(tmp_path, empty_lerobot_dataset_factory):
+    features = {"image": {"dtype": "video", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]}}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, streaming_encoding=True
+    )
+    for _ in range(3):
+        dataset.add_frame({"image": np.random.randint(0, 256, DUMMY_HWC, dtype=np.uint8)}, task="Dummy task")
+    video_path = dataset.root / dataset.meta.get_video_file_path(0, "image")
+    dataset.clear_episode_buffer()
+
+    assert dataset.streaming_encoders == {}
+    assert not video_path.exists()
+
+    # The next episode is recorded with new encoders
+    dataset.add_frame({"image": np.random.randint(0, 256, DUMMY_HWC, dtype=np.uint8)}, task="Dummy task")
+    dataset.save_episode()
+    assert video_path.is_file()
+
+
+def test_streaming_encoding_bounds_stats_frames(tmp_path, empty_lerobot_dataset_factory, monkeypatch):
+    monkeypatch.setattr("lerobot.datasets.lerobot_dataset.MAX_STREAMING_STATS_FRAMES", 4)
+    features = {"image": {"dtype": "video", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]}}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, streaming_encoding=True
+    )
+    frames = [{"image": np.full(DUMMY_HWC, i, dtype=np.uint8)} for i in range(10)]
+    dataset.add_frames(frames, task="Dummy task")
+
+    # Frames 0, 4 and 8 are kept once the stride has doubled twice
+    assert [thumbnail[0, 0, 0] for thumbnail in dataset.episode_buffer["image"]] == [0, 4, 8]
+    dataset.save_episode()
+    assert dataset.streaming_stats_strides == {}
+
+
 def test_image_array_to_pil_image_wrong_range_float_0_255():
     image = np.random.rand(*DUMMY_HWC) * 255
     with pytest.raises(ValueError):